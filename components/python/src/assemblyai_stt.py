@@ -16,10 +16,25 @@ from typing import AsyncIterator, Optional
 from urllib.parse import urlencode
 
 import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
 
 from events import STTChunkEvent, STTEvent, STTOutputEvent
 
+try:
+    # orjson is pulled in by langsmith; its decoder is several times faster
+    # than the stdlib on the partial-transcript hot path.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# AssemblyAI rejects audio messages longer than 1000ms, so coalesced batches
+# are capped at one second of 16-bit mono PCM.
+_MAX_BATCH_MS = 1000
+
+# send_audio waits for the sender once this many batches are queued, so a
+# stalled uplink throttles the caller instead of growing the buffer
+_MAX_BUFFERED_BATCHES = 4
+
 
 class AssemblyAISTT:
     def __init__(
@@ -34,9 +49,26 @@ class AssemblyAISTT:
 
         self.sample_rate = sample_rate
         self.format_turns = format_turns
-        self._ws: Optional[WebSocketClientProtocol] = None
+        params = urlencode(
+            {
+                "sample_rate": self.sample_rate,
+                "format_turns": str(self.format_turns).lower(),
+            }
+        )
+        self._url = f"wss://streaming.assemblyai.com/v3/ws?{params}"
+        self._headers = {"Authorization": self.api_key}
+        self._ws: Optional[ClientConnection] = None
         self._connection_signal = asyncio.Event()
         self._close_signal = asyncio.Event()
+        self._send_buffer = bytearray()
+        self._send_signal = asyncio.Event()
+        self._drained_signal = asyncio.Event()
+        self._send_task: Optional[asyncio.Task[None]] = None
+        # Cached connection state so send_audio skips _ensure_connection
+        # while the socket is known to be open
+        self._is_open = False
+        self._max_batch_bytes = sample_rate * 2 * _MAX_BATCH_MS // 1000
+        self._max_buffered_bytes = self._max_batch_bytes * _MAX_BUFFERED_BATCHES
 
     async def receive_events(self) -> AsyncIterator[STTEvent]:
         while not self._close_signal.is_set():
@@ -57,24 +89,31 @@ class AssemblyAISTT:
 
             if self._ws and self._ws.close_code is None:
                 self._connection_signal.clear()
+                # Bind the socket once; close() may reset self._ws while this
+                # generator is suspended at a yield.
+                ws = self._ws
                 try:
-                    async for raw_message in self._ws:
+                    while True:
+                        # Receive text frames undecoded; the JSON decoder reads
+                        # UTF-8 bytes directly, saving a str round-trip.
+                        raw_message = await ws.recv(decode=False)
                         try:
-                            message = json.loads(raw_message)
+                            message = _json_loads(raw_message)
                             message_type = message.get("type")
 
                             if message_type == "Begin":
                                 pass
                             elif message_type == "Turn":
                                 transcript = message.get("transcript", "")
-                                turn_is_formatted = message.get(
-                                    "turn_is_formatted", False
-                                )
 
-                                if turn_is_formatted:
-                                    if transcript:
-                                        yield STTOutputEvent.create(transcript)
+                                if message.get("turn_is_formatted"):
+                                    # Empty finals carry nothing for the agent
+                                    if not transcript:
+                                        continue
+                                    yield STTOutputEvent.create(transcript)
                                 else:
+                                    # Empty partials are still forwarded; the
+                                    # client uses the first one to mark turn start
                                     yield STTChunkEvent.create(transcript)
 
                             elif message_type == "Termination":
@@ -87,20 +126,71 @@ class AssemblyAISTT:
                         except json.JSONDecodeError as e:
                             print(f"[DEBUG] AssemblyAISTT JSON decode error: {e}")
                             continue
+                except websockets.exceptions.ConnectionClosedOK:
+                    self._is_open = False
                 except websockets.exceptions.ConnectionClosed:
+                    self._is_open = False
                     print("AssemblyAISTT: WebSocket connection closed")
 
     async def send_audio(self, audio_chunk: bytes) -> None:
-        ws = await self._ensure_connection()
-        await ws.send(audio_chunk)
+        if not self._is_open:
+            await self._ensure_connection()
+        # Queue the chunk for the sender task instead of writing it directly.
+        # Chunks that arrive while a previous send is in flight are coalesced
+        # into a single WebSocket frame.
+        self._raise_if_sender_failed()
+        self._send_buffer += audio_chunk
+        self._send_signal.set()
+        if len(self._send_buffer) > self._max_buffered_bytes:
+            self._drained_signal.clear()
+            await self._drained_signal.wait()
+            self._raise_if_sender_failed()
 
     async def close(self) -> None:
+        self._is_open = False
+        if self._send_task:
+            # A failed sender has already been reported through send_audio
+            if not self._send_task.done():
+                with contextlib.suppress(asyncio.CancelledError):
+                    self._send_task.cancel()
+                    await self._send_task
+            self._send_task = None
         if self._ws and self._ws.close_code is None:
+            # Flush audio still waiting in the buffer before closing
+            with contextlib.suppress(websockets.exceptions.ConnectionClosed):
+                await self._flush(self._ws)
             await self._ws.close()
         self._ws = None
         self._close_signal.set()
 
-    async def _ensure_connection(self) -> WebSocketClientProtocol:
+    async def _send_loop(self, ws: ClientConnection) -> None:
+        try:
+            while True:
+                await self._send_signal.wait()
+                self._send_signal.clear()
+                await self._flush(ws)
+        except websockets.exceptions.ConnectionClosed:
+            # receive_events() reports the closed connection
+            self._is_open = False
+        finally:
+            # Never leave send_audio waiting on a sender that has stopped
+            self._drained_signal.set()
+
+    def _raise_if_sender_failed(self) -> None:
+        if self._send_task and self._send_task.done():
+            if not self._send_task.cancelled():
+                # Re-raises the error that stopped the sender, if any
+                self._send_task.result()
+
+    async def _flush(self, ws: ClientConnection) -> None:
+        while self._send_buffer:
+            batch = bytes(self._send_buffer[: self._max_batch_bytes])
+            del self._send_buffer[: self._max_batch_bytes]
+            await ws.send(batch)
+            if len(self._send_buffer) <= self._max_buffered_bytes:
+                self._drained_signal.set()
+
+    async def _ensure_connection(self) -> ClientConnection:
         if self._close_signal.is_set():
             raise RuntimeError(
                 "AssemblyAISTT tried establishing a connection after it was closed"
@@ -108,16 +198,12 @@ class AssemblyAISTT:
         if self._ws and self._ws.close_code is None:
             return self._ws
 
-        params = urlencode(
-            {
-                "sample_rate": self.sample_rate,
-                "format_turns": str(self.format_turns).lower(),
-            }
-        )
-        url = f"wss://streaming.assemblyai.com/v3/ws?{params}"
-        self._ws = await websockets.connect(
-            url, additional_headers={"Authorization": self.api_key}
-        )
+        self._ws = await websockets.connect(self._url, additional_headers=self._headers)
+        if self._send_task:
+            # The previous sender is bound to the dead connection
+            self._send_task.cancel()
+        self._send_task = asyncio.create_task(self._send_loop(self._ws))
+        self._is_open = True
 
         self._connection_signal.set()
         return self._ws